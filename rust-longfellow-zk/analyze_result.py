@@ -1,18 +1,20 @@
+from constants import P as p
+from limbs import pack, fmt128
+
 result_low = 0x3fffffffffffffff
 result_high = 0x00000ffffffffffc
-result = result_low | (result_high << 64)
-print(f'Result = 0x{result:032x}')
+result = pack(result_low, result_high)
+print(f'Result = {fmt128(result)}')
 print(f'Result = {result}')
 
-p = (1 << 128) - (1 << 108) + 1
-print(f'\np = 0x{p:032x}')
+print(f'\np = {fmt128(p)}')
 
 # What is this result mod p?
 print(f'\nresult mod p = {result % p}')
-print(f'result mod p = 0x{result % p:032x}')
+print(f'result mod p = {fmt128(result % p)}')
 
 # Is it p-1?
-print(f'\np - 1 = 0x{(p-1):032x}')
+print(f'\np - 1 = {fmt128(p - 1)}')
 print(f'result == p-1? {result == p-1}')
 
 # Is it p?
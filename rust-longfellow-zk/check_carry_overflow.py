@@ -1,3 +1,5 @@
+from limbs import adc, fmt128, mul_wide
+
 print("Checking carry overflow in iteration 1:")
 print()
 
@@ -10,11 +12,10 @@ print(f"carry = 0x{carry:016x}")
 
 # What should happen
 sum_full = t3_before + carry
-print(f"\nt[3] + carry = 0x{sum_full:032x}")
+print(f"\nt[3] + carry = {fmt128(sum_full)}")
 
 # What happens with 64-bit arithmetic
-sum_64bit = (t3_before + carry) & 0xffffffffffffffff
-carry_out = 1 if sum_full > 0xffffffffffffffff else 0
+sum_64bit, carry_out = adc(t3_before, carry)
 
 print(f"\nWith 64-bit arithmetic:")
 print(f"sum = 0x{sum_64bit:016x}")
@@ -37,17 +38,15 @@ print("\n--- What should happen ---")
 k = 0xffffe00000000000
 p1 = 0xfffff00000000000
 
-lo = (k * p1) & 0xffffffffffffffff
-hi = (k * p1) >> 64
+lo, hi = mul_wide(k, p1)
 
 print(f"k * p[1]:")
 print(f"  k = 0x{k:016x}")
 print(f"  p[1] = 0x{p1:016x}")
 
 # Let's compute this properly
-import math
 prod = k * p1
-print(f"  product = 0x{prod:032x}")
+print(f"  product = {fmt128(prod)}")
 print(f"  lo = 0x{lo:016x}")
 print(f"  hi = 0x{hi:016x}")
 
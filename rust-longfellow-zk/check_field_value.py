@@ -1,13 +1,13 @@
-p = (1 << 128) - (1 << 108) + 1
-R = (1 << 128) % p
+from constants import P as p, R
+from limbs import pack, fmt128
 
 result_low = 0x3fffffffffffffff
 result_high = 0x00000ffffffffffc
-result = result_low | (result_high << 64)
+result = pack(result_low, result_high)
 
-print(f"p = 0x{p:032x}")
-print(f"R = 0x{R:032x}")
-print(f"result = 0x{result:032x}")
+print(f"p = {fmt128(p)}")
+print(f"R = {fmt128(R)}")
+print(f"result = {fmt128(result)}")
 
 print(f"\np = {p}")
 print(f"R = {R}")
@@ -29,4 +29,4 @@ print(f"Is result == p - 1? {result == p - 1}")
 # Let's check if result + something = p
 diff = p - result
 print(f"\np - result = {diff}")
-print(f"p - result = 0x{diff:032x}")
\ No newline at end of file
+print(f"p - result = {fmt128(diff)}")
\ No newline at end of file
@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+
+# Check the roots of unity returned by Fp128::get_root_of_unity
+#
+# get_root_of_unity decodes omega_32 from bytes hard-coded in
+# longfellow-algebra/src/field/fp128.rs and returns omega_32^(2^(32 - log_n)).
+# omega_32 should be 59^((p-1)/2^32), 59 being the smallest primitive root
+# mod p. Squaring walks down the table, omega_{2^(k-1)} = omega_{2^k}^2, so
+# one chain of 32 squarings yields the root for every supported n.
+#
+# Set VERBOSE=1 to also list the roots themselves.
+
+import os
+
+from constants import OMEGA_32, P as p, P_MINUS_1
+from fp128 import is_primitive_root, square_chain
+from limbs import fmt128
+
+GENERATOR = 59
+
+# omega_32 as hard-coded in longfellow-algebra/src/field/fp128.rs
+RUST_OMEGA_32_BYTES = (b'\x7d\x0b\x89\x6c\x63\xd7\x3c\xbd'
+                       b'\x95\x20\xb3\x04\x2b\xdb\x0b\x4b')
+
+
+def verify_roots():
+    """Return [omega_(2^k) for k in 0..32], checking each root is primitive"""
+    assert is_primitive_root(GENERATOR)
+    assert int.from_bytes(RUST_OMEGA_32_BYTES, 'little') == OMEGA_32
+    assert OMEGA_32 == pow(GENERATOR, P_MINUS_1 >> 32, p)
+
+    # omegas[k] is a primitive 2^k-th root of unity
+    omegas = square_chain(OMEGA_32, 32)[::-1]
+
+    # Squaring omegas[k] (k >= 1) k-1 times lands on omegas[1] and k times on
+    # omegas[0], so these two checks prove every entry is primitive
+    assert omegas[0] == 1
+    assert omegas[1] == p - 1
+
+    return omegas
+
+
+if __name__ == "__main__":
+    omegas = verify_roots()
+
+    if os.getenv("VERBOSE"):
+        print("Roots of unity:")
+        for log_n, omega in enumerate(omegas):
+            print(f"  n = 2^{log_n:<2}: {fmt128(omega)}")
+        print()
+
+    print(f"✅ omega_32 in fp128.rs is {GENERATOR}^((p-1)/2^32); "
+          f"all {len(omegas)} roots are primitive")
@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+
+# Precomputed constants for Fp128: p = 2^128 - 2^108 + 1
+#
+# Run this file directly to re-verify the literals.
+
+__all__ = [
+    "P", "P_MINUS_1", "R", "R2", "R_INV", "INV", "INV128",
+    "MASK64", "MASK128", "P_MINUS_1_PRIME_FACTORS", "OMEGA_32",
+]
+
+P = 0xfffff000000000000000000000000001
+P_MINUS_1 = P - 1
+
+# Montgomery parameter R = 2^128 mod p = 2^108 - 1
+R = 0x00000fffffffffffffffffffffffffff
+
+# R^2 mod p
+R2 = 0x000fdffffeffffeffffeffffefffff01
+
+# R^(-1) mod p, for converting out of Montgomery form
+R_INV = 0xffffe000010000000000000000000000
+
+# -p^(-1) mod 2^64
+INV = 0xFFFFFFFFFFFFFFFF
+
+# -p^(-1) mod 2^128, for reducing a full 128-bit word at once
+INV128 = 0xffffefffffffffffffffffffffffffff
+
+MASK64 = (1 << 64) - 1
+MASK128 = (1 << 128) - 1
+
+# Distinct prime factors of p - 1 = 2^108 * (2^20 - 1) = 2^108 * 3 * 5^2 * 11 * 31 * 41
+P_MINUS_1_PRIME_FACTORS = (2, 3, 5, 11, 31, 41)
+
+# Primitive 2^32-th root of unity 59^((p-1)/2^32), 59 being the smallest
+# primitive root; the omega_32 hard-coded in fp128.rs
+OMEGA_32 = 99753660205281253039813454253403999101
+
+if __name__ == "__main__":
+    assert P == (1 << 128) - (1 << 108) + 1
+    assert R == (1 << 128) % P
+    assert R2 == (R * R) % P
+    assert (R * R_INV) % P == 1
+    assert INV == (-pow(P, -1, 1 << 64)) % (1 << 64)
+    assert INV128 == (-pow(P, -1, 1 << 128)) % (1 << 128)
+    n = P_MINUS_1
+    for q in P_MINUS_1_PRIME_FACTORS:
+        while n % q == 0:
+            n //= q
+    assert n == 1
+    assert OMEGA_32 == pow(59, P_MINUS_1 >> 32, P)
+    print("✅ All constants verified")
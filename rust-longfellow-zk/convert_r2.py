@@ -1,19 +1,20 @@
 #!/usr/bin/env python3
 
+from limbs import pack, fmt128, to_limbs
+
 # Convert R^2 to limbs
 r2 = 0x000fdffffeffffeffffeffffefffff01
 
-print(f"R^2 = 0x{r2:032x}")
+print(f"R^2 = {fmt128(r2)}")
 
 # Extract limbs (little-endian)
-limb0 = r2 & 0xffffffffffffffff
-limb1 = (r2 >> 64) & 0xffffffffffffffff
+limb0, limb1 = to_limbs(r2)
 
 print(f"\nLimbs (little-endian):")
 print(f"limb[0] = 0x{limb0:016x}")
 print(f"limb[1] = 0x{limb1:016x}")
 
 # Verify
-reconstructed = limb0 | (limb1 << 64)
-print(f"\nReconstructed: 0x{reconstructed:032x}")
+reconstructed = pack(limb0, limb1)
+print(f"\nReconstructed: {fmt128(reconstructed)}")
 print(f"Match: {reconstructed == r2}")
\ No newline at end of file
@@ -0,0 +1,52 @@
+#!/usr/bin/env python3
+
+# Run several of the Fp128 debugging scripts in a single Python process
+#
+# Interpreter start-up and the shared helper modules (constants, fp128, limbs)
+# are paid once, instead of once per script.
+#
+# Usage:
+#   python diagnostics.py                 # run every script
+#   python diagnostics.py check_omega verify_r2
+
+import argparse
+import os
+import runpy
+
+SCRIPTS = [
+    "analyze_result",
+    "check_carry_overflow",
+    "check_field_value",
+    "check_omega",
+    "check_result",
+    "check_roots",
+    "check_six_modp",
+    "convert_r2",
+    "investigate_six",
+    "mont",
+    "test_montgomery",
+    "trace_six_mult",
+    "trace_why_two",
+    "verify_mont_math",
+    "verify_r2",
+]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run Fp128 diagnostic scripts")
+    parser.add_argument("scripts", nargs="*", metavar="script",
+                        help=f"scripts to run (default: all): {', '.join(SCRIPTS)}")
+    args = parser.parse_args()
+
+    unknown = [name for name in args.scripts if name not in SCRIPTS]
+    if unknown:
+        parser.error(f"unknown script(s): {', '.join(unknown)}")
+
+    here = os.path.dirname(os.path.abspath(__file__))
+    for name in args.scripts or SCRIPTS:
+        print(f"\n===== {name} =====")
+        runpy.run_path(os.path.join(here, f"{name}.py"), run_name="__main__")
+
+
+if __name__ == "__main__":
+    main()
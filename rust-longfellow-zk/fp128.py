@@ -0,0 +1,38 @@
+#!/usr/bin/env python3
+
+# Arithmetic helpers for Fp128: p = 2^128 - 2^108 + 1
+#
+# The prime is fixed (see constants.py), so every reduction uses the same modulus.
+
+from constants import P, P_MINUS_1, P_MINUS_1_PRIME_FACTORS
+
+# Exponents (p-1)/q for the primitive-root test, shared by every candidate
+_PRIMITIVE_ROOT_EXPS = tuple(P_MINUS_1 // q for q in P_MINUS_1_PRIME_FACTORS)
+
+
+def sqmod_p108(x):
+    """Compute x^2 mod p"""
+    return (x * x) % P
+
+
+def square_chain(x, n, capture_from=0):
+    """Return [x^(2^k) mod p for k in capture_from..n] from n successive squarings
+
+    Only the squares from step capture_from onwards are kept.
+    """
+    x %= P
+    chain = [x] if capture_from == 0 else []
+    for k in range(1, n + 1):
+        x = sqmod_p108(x)
+        if k >= capture_from:
+            chain.append(x)
+    return chain
+
+
+def is_primitive_root(g):
+    """Check whether g generates the multiplicative group of Fp128
+
+    g is a generator iff g^((p-1)/q) != 1 for every prime q dividing p - 1,
+    so only the actual prime factors of p - 1 need testing.
+    """
+    return all(pow(g, e, P) != 1 for e in _PRIMITIVE_ROOT_EXPS)
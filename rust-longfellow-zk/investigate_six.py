@@ -1,8 +1,12 @@
 #!/usr/bin/env python3
 
-p = (1 << 128) - (1 << 108) + 1
+import sys
+
+from constants import P as p, R, R2
+from limbs import fmt128
+
 print(f"p = {p}")
-print(f"p = 0x{p:032x}")
+print(f"p = {fmt128(p)}")
 
 # Check divisibility
 print(f"\np mod 2 = {p % 2}")
@@ -19,29 +23,30 @@ print(f"(p-1) mod 6 = {(p-1) % 6}")
 # The order is the smallest k such that 6^k ≡ 1 (mod p)
 
 print("\nChecking powers of 6:")
+lines = []
 val = 1
 for i in range(1, 20):
     val = (val * 6) % p
-    print(f"6^{i} mod p = {val}")
+    lines.append(f"6^{i} mod p = {val}")
     if val == 1:
-        print(f"Order of 6 is {i}")
+        lines.append(f"Order of 6 is {i}")
         break
+sys.stdout.write("\n".join(lines) + "\n")
 
 # Let's also check what 6R mod p is in Montgomery form
-R = (1 << 128) % p
 print(f"\nR = {R}")
 print(f"6R mod p = {(6 * R) % p}")
-print(f"6R mod p = 0x{(6 * R) % p:032x}")
+print(f"6R mod p = {fmt128((6 * R) % p)}")
 
 # And check the inverse
 six_inv = pow(6, -1, p)
 print(f"\n6^(-1) mod p = {six_inv}")
-print(f"6^(-1) mod p = 0x{six_inv:032x}")
+print(f"6^(-1) mod p = {fmt128(six_inv)}")
 
 # In Montgomery form
 six_inv_R = (six_inv * R) % p
 print(f"\n6^(-1) * R mod p = {six_inv_R}")
-print(f"6^(-1) * R mod p = 0x{six_inv_R:032x}")
+print(f"6^(-1) * R mod p = {fmt128(six_inv_R)}")
 
 # Check if there's something special about the product
 print(f"\n6 * 6^(-1) mod p = {(6 * six_inv) % p}")
@@ -50,12 +55,11 @@ print(f"\n6 * 6^(-1) mod p = {(6 * six_inv) % p}")
 six_R = (6 * R) % p
 product_before_reduction = (six_R * six_inv_R) % p
 print(f"\n(6R) * (6^(-1)R) mod p = {product_before_reduction}")
-print(f"(6R) * (6^(-1)R) mod p = 0x{product_before_reduction:032x}")
+print(f"(6R) * (6^(-1)R) mod p = {fmt128(product_before_reduction)}")
 
 # This should give R^2, which after Montgomery reduction gives R
-R2 = (R * R) % p
 print(f"\nR^2 mod p = {R2}")
-print(f"R^2 mod p = 0x{R2:032x}")
+print(f"R^2 mod p = {fmt128(R2)}")
 
 if product_before_reduction == R2:
     print("\n✅ (6R) * (6^(-1)R) = R^2 (correct before reduction)")
\ No newline at end of file
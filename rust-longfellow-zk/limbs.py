@@ -0,0 +1,41 @@
+#!/usr/bin/env python3
+
+# Helpers for moving between 128-bit values and pairs of 64-bit limbs
+
+import struct
+from functools import lru_cache
+
+from constants import MASK64
+
+
+def to_limbs(x, n=2):
+    """Split x into n little-endian 64-bit limbs"""
+    return list(struct.unpack(f"<{n}Q", x.to_bytes(8 * n, "little")))
+
+
+def pack(lo, hi):
+    """Combine little-endian 64-bit limbs into a 128-bit value"""
+    return lo | (hi << 64)
+
+
+def adc(a, b, carry=0):
+    """Add two 64-bit limbs with carry-in, wrapping like u64; return (sum, carry_out)"""
+    s = a + b + carry
+    return s & MASK64, s >> 64
+
+
+def mul_wide(a, b):
+    """Multiply two 64-bit limbs into a 128-bit product; return (lo, hi)"""
+    prod = a * b
+    return prod & MASK64, prod >> 64
+
+
+@lru_cache(maxsize=128)
+def fmt128(x):
+    """Format a 128-bit value as zero-padded hex"""
+    return f"0x{x:032x}"
+
+
+def fmt_limbs(limbs):
+    """Format a list of 64-bit limbs as zero-padded hex, e.g. [0x..., 0x...]"""
+    return "[" + ", ".join(f"0x{x:016x}" for x in limbs) + "]"
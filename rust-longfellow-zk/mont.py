@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+
+# Reference Montgomery reduction for Fp128: p = 2^128 - 2^108 + 1, R = 2^128
+#
+# This is the single Python REDC the debugging scripts check the Rust code
+# against.
+
+from constants import INV128, MASK64, MASK128, OMEGA_32, P, R, R_INV
+
+
+def mul_by_p(m):
+    """Compute m * p using only shifts and adds
+
+    p = 2^128 - 2^108 + 1 is sparse, so m * p = (m << 128) - (m << 108) + m.
+    This is the multiplication-free form limb code can use; on Python ints a
+    plain `m * P` is faster, so only the debug trace goes through here.
+    """
+    return (m << 128) - (m << 108) + m
+
+
+def redc(T, debug=False):
+    """Montgomery reduction: compute T * R^(-1) mod p where R = 2^128
+
+    Python ints are arbitrary precision, so the whole 128-bit word is reduced
+    in one step: m = T * (-p^(-1)) mod 2^128 makes T + m*p divisible by 2^128.
+    With debug=True the two 64-bit limb iterations are traced instead.
+    """
+    if not debug:
+        m = ((T & MASK128) * INV128) & MASK128
+        result = (T + m * P) >> 128
+        # Branchless conditional subtraction
+        result -= P & -(result >= P)
+        return result
+
+    # Limb-level trace, specialized for p = 2^128 - 2^108 + 1. Since
+    # INV = -p^(-1) mod 2^64 is -1, each m = t_i * INV mod 2^64 is just -t_i.
+
+    # Iteration 0: clear limb 0
+    m0 = -T & MASK64
+    T = T + mul_by_p(m0)
+    print(f"  m0 = 0x{m0:016x}")
+    print(f"    m0 << 128 = 0x{m0 << 128:064x}")
+    print(f"    m0 << 108 = 0x{m0 << 108:064x}")
+    print(f"    T + (m0 << 128) - (m0 << 108) + m0 = 0x{T:064x}")
+
+    # Iteration 1: clear limb 1
+    m1 = -(T >> 64) & MASK64
+    T = T + (mul_by_p(m1) << 64)
+    print(f"  m1 = 0x{m1:016x}")
+    print(f"    m1 << 192 = 0x{m1 << 192:064x}")
+    print(f"    m1 << 172 = 0x{m1 << 172:064x}")
+    print(f"    T + (m1 << 192) - (m1 << 172) + (m1 << 64) = 0x{T:064x}")
+
+    # Divide by R = 2^128
+    result = T >> 128
+
+    # Branchless conditional subtraction
+    result -= P & -(result >= P)
+
+    return result
+
+
+def montgomery_mult(a, b):
+    """Multiply two values in Montgomery form: a * b * R^(-1) mod p"""
+    return redc(a * b)
+
+
+def to_mont(a):
+    """Convert a into Montgomery form: a * R mod p"""
+    return (a * R) % P
+
+
+def from_mont(a):
+    """Convert a out of Montgomery form: a * R^(-1) mod p"""
+    return (a * R_INV) % P
+
+
+if __name__ == "__main__":
+    # (a, b, expected a * b mod p)
+    CASES = [
+        (P - 1, P - 1, 1),
+        (2, 3, 6),
+        (6, pow(6, -1, P), 1),
+        (OMEGA_32, OMEGA_32, OMEGA_32 * OMEGA_32 % P),
+    ]
+
+    for a, b, expected in CASES:
+        got = from_mont(montgomery_mult(to_mont(a), to_mont(b)))
+        assert got == expected % P, (a, b, expected, got)
+    print(f"✅ {len(CASES)} Montgomery multiplication cases passed")
@@ -1,92 +1,90 @@
 #!/usr/bin/env python3
 
 # Test Montgomery arithmetic for Fp128
+#
+# Set VERBOSE=1 to trace each iteration of the manual reduction.
+
+import os
+
+from constants import P as p, R, R2, R_INV, INV, MASK64
+from limbs import adc, fmt128, fmt_limbs, mul_wide, to_limbs
 
 # Field: p = 2^128 - 2^108 + 1
-p = (1 << 128) - (1 << 108) + 1
 print(f"p = 2^128 - 2^108 + 1")
-print(f"p = 0x{p:032x}")
+print(f"p = {fmt128(p)}")
 print(f"p = {p}")
 
 # Montgomery parameter R = 2^128 mod p
-R = (1 << 128) % p
 print(f"\nR = 2^128 mod p")
-print(f"R = 0x{R:032x}")
+print(f"R = {fmt128(R)}")
 print(f"R = {R}")
 print(f"R = 2^108 - 1 = {(1 << 108) - 1}")
 assert R == (1 << 108) - 1
 
 # R^2 mod p
-R2 = (R * R) % p
-print(f"\nR^2 mod p = 0x{R2:032x}")
+print(f"\nR^2 mod p = {fmt128(R2)}")
 print(f"R^2 mod p = {R2}")
 
 # Montgomery form of 1 is R
-print(f"\nMontgomery form of 1 = R = 0x{R:032x}")
+print(f"\nMontgomery form of 1 = R = {fmt128(R)}")
 
 # To convert from Montgomery form, we compute a * R^(-1) mod p
-# Find R^(-1) mod p using extended GCD
-def egcd(a, b):
-    if a == 0:
-        return b, 0, 1
-    gcd, x1, y1 = egcd(b % a, a)
-    x = y1 - (b // a) * x1
-    y = x1
-    return gcd, x, y
-
-gcd, x, _ = egcd(R, p)
-R_inv = x % p
-print(f"\nR^(-1) mod p = 0x{R_inv:032x}")
+print(f"\nR^(-1) mod p = {fmt128(R_INV)}")
 
 # Verify R * R^(-1) = 1 mod p
-assert (R * R_inv) % p == 1
+assert (R * R_INV) % p == 1
 
 # from_montgomery(R) should give 1
-result = (R * R_inv) % p
+result = (R * R_INV) % p
 print(f"\nfrom_montgomery(R) = R * R^(-1) mod p = {result}")
 assert result == 1
 
 # Now let's check what -p^(-1) mod 2^64 should be
 # First find p^(-1) mod 2^64
-p_low = p & ((1 << 64) - 1)
+p_low = p & MASK64
 print(f"\np mod 2^64 = {p_low}")
 
 # Since p ≡ 1 (mod 2^64), we have p^(-1) ≡ 1 (mod 2^64)
 # Therefore -p^(-1) ≡ -1 ≡ 2^64 - 1 (mod 2^64)
-mprime = (1 << 64) - 1
+mprime = INV
+assert mprime == pow((-p) % (1 << 64), -1, 1 << 64) == MASK64
 print(f"-p^(-1) mod 2^64 = 0x{mprime:016x}")
 
 # Test Montgomery reduction manually
+trace = bool(os.getenv("VERBOSE"))
 print("\n\nManual Montgomery reduction test:")
 print("Computing from_montgomery(R)...")
 
 # Input: R
-t = [0] * 4
-t[0] = R & ((1 << 64) - 1)
-t[1] = (R >> 64) & ((1 << 64) - 1)
-print(f"Initial t = [0x{t[0]:016x}, 0x{t[1]:016x}, 0x{t[2]:016x}, 0x{t[3]:016x}]")
+t = to_limbs(R, 4)
+print(f"Initial t = {fmt_limbs(t)}")
 
 # Montgomery reduction
+p_limbs = to_limbs(p)
 for i in range(2):
-    m = (t[i] * mprime) & ((1 << 64) - 1)
-    print(f"\nIteration {i}: m = 0x{m:016x}")
-    
-    # Add m * p to t
+    m = (t[i] * mprime) & MASK64
+    if trace:
+        print(f"\nIteration {i}: m = 0x{m:016x}")
+
+    # Add m * p to t, one u64 x u64 product per limb of p
     carry = 0
-    temp = m * p
-    for j in range(4):
-        if i + j < 4:
-            val = t[i + j] + ((temp >> (64 * j)) & ((1 << 64) - 1)) + carry
-            t[i + j] = val & ((1 << 64) - 1)
-            carry = val >> 64
-    
-    print(f"After iteration {i}: t = [0x{t[0]:016x}, 0x{t[1]:016x}, 0x{t[2]:016x}, 0x{t[3]:016x}]")
+    for j in range(len(p_limbs)):
+        lo, hi = mul_wide(m, p_limbs[j])
+        t[i + j], c = adc(t[i + j], lo, carry)
+        carry = hi + c
+
+    # Propagate the final carry into the remaining limbs
+    for k in range(i + len(p_limbs), 4):
+        t[k], carry = adc(t[k], carry)
+
+    if trace:
+        print(f"After iteration {i}: t = {fmt_limbs(t)}")
 
 # Result is in upper half
 result_low = t[2]
 result_high = t[3]
 result = (result_high << 64) | result_low
-print(f"\nResult = 0x{result:032x}")
+print(f"\nResult = {fmt128(result)}")
 print(f"Result = {result}")
 
 # Check if this equals 1
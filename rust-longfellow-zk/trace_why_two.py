@@ -1,7 +1,7 @@
-p = (1 << 128) - (1 << 108) + 1
-R = (1 << 128) % p
-print(f"p = 0x{p:032x}")
-print(f"R = 0x{R:032x}")
+from constants import P as p, R, R2
+from limbs import fmt128
+print(f"p = {fmt128(p)}")
+print(f"R = {fmt128(R)}")
 
 # We're getting 2 instead of 1
 # In Montgomery form:
@@ -9,21 +9,21 @@ print(f"R = 0x{R:032x}")
 # 2 is represented as 2R mod p
 
 two_mont = (2 * R) % p
-print(f"\n2 in Montgomery form = 0x{two_mont:032x}")
+print(f"\n2 in Montgomery form = {fmt128(two_mont)}")
 
 # So if we're getting 2, that means we're getting 2R instead of R
 # This suggests we're doubling the result somewhere
 
 # Let's trace through what should happen:
 # 6 * 6^(-1) in Montgomery form = (6R)(6^(-1)R) = R^2 mod p
-r_squared = (R * R) % p
-print(f"\nR² mod p = 0x{r_squared:032x}")
+r_squared = R2
+print(f"\nR² mod p = {fmt128(r_squared)}")
 
 # After Montgomery reduction: REDC(R²) = R² * R^(-1) mod p = R
-print(f"REDC(R²) should give R = 0x{R:032x}")
+print(f"REDC(R²) should give R = {fmt128(R)}")
 
 # But we're getting 2R mod p
-print(f"We're getting 2R mod p = 0x{two_mont:032x}")
+print(f"We're getting 2R mod p = {fmt128(two_mont)}")
 
 # Why would we get 2R?
 # One possibility: we're adding R when we shouldn't
@@ -1,21 +1,20 @@
 #!/usr/bin/env python3
 
 # Verify R^2 calculation
-p = (1 << 128) - (1 << 108) + 1
-R = (1 << 128) % p
+from constants import P as p, R
+from limbs import pack, fmt128, to_limbs
 
-print(f"p = 0x{p:032x}")
-print(f"R = 0x{R:032x}")
+print(f"p = {fmt128(p)}")
+print(f"R = {fmt128(R)}")
 print(f"R = {R}")
 
 # Calculate R^2 mod p
 R2 = (R * R) % p
-print(f"\nR^2 mod p = 0x{R2:032x}")
+print(f"\nR^2 mod p = {fmt128(R2)}")
 print(f"R^2 = {R2}")
 
 # Convert to limbs
-r2_low = R2 & 0xffffffffffffffff
-r2_high = (R2 >> 64) & 0xffffffffffffffff
+r2_low, r2_high = to_limbs(R2)
 
 print(f"\nR^2 limbs:")
 print(f"  limbs[0] = 0x{r2_low:016x}")
@@ -39,17 +38,13 @@ r_low = 0xffffffffffffffff
 r_high = 0x00000fffffffffff
 
 # Multiply as 128-bit value
-r_value = r_low | (r_high << 64)
+r_value = pack(r_low, r_high)
 r_squared = r_value * r_value
 
 print(f"\n\nR * R (before mod) = 0x{r_squared:064x}")
 
 # Split into limbs
-limbs = []
-temp = r_squared
-for i in range(4):
-    limbs.append(temp & 0xffffffffffffffff)
-    temp >>= 64
+limbs = to_limbs(r_squared, 4)
 
 print("\nR * R limbs (before reduction):")
 for i, limb in enumerate(limbs):